@@ -5,6 +5,7 @@ This example demonstrates how to use the GameAgent system programmatically.
 """
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 
@@ -15,6 +16,13 @@ from GameAgent import GameOrchestrator, Config
 from GameAgent.models import UserRequirement, GameGenre, GamePlatform
 
 
+@functools.lru_cache(maxsize=1)
+def get_orchestrator():
+    """Return an orchestrator shared by all examples in this module."""
+    config = Config.from_env()
+    return GameOrchestrator(config)
+
+
 async def create_snake_game():
     """Create a classic snake game."""
     
@@ -39,11 +47,8 @@ async def create_snake_game():
         ]
     )
     
-    # Create orchestrator and run
-    config = Config.from_env()
-    orchestrator = GameOrchestrator(config)
-    
-    game_code, review = await orchestrator.develop_game(requirement)
+    # Run with the shared orchestrator
+    game_code, review = await get_orchestrator().develop_game(requirement)
     
     print(f"\n✅ Game created successfully!")
     print(f"📊 Final score: {review.overall_score}/100")
@@ -69,10 +74,7 @@ async def create_pong_game():
         additional_features=["Two player mode", "Sound effects (beeps)"]
     )
     
-    config = Config.from_env()
-    orchestrator = GameOrchestrator(config)
-    
-    return await orchestrator.develop_game(requirement)
+    return await get_orchestrator().develop_game(requirement)
 
 
 async def create_puzzle_game():
@@ -92,10 +94,7 @@ async def create_puzzle_game():
         target_audience="Puzzle lovers"
     )
     
-    config = Config.from_env()
-    orchestrator = GameOrchestrator(config)
-    
-    return await orchestrator.develop_game(requirement)
+    return await get_orchestrator().develop_game(requirement)
 
 
 async def create_platformer():
@@ -116,10 +115,7 @@ async def create_platformer():
         additional_features=["Parallax background", "Coin counter"]
     )
     
-    config = Config.from_env()
-    orchestrator = GameOrchestrator(config)
-    
-    return await orchestrator.develop_game(requirement)
+    return await get_orchestrator().develop_game(requirement)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import pygame
 import sys
 import random
+from collections import deque
 
 # Initialize pygame
 pygame.init()
@@ -17,21 +18,41 @@ ITEM_COLOR = (255, 255, 210)
 OBSTACLE_COLOR = (84, 56, 100)
 TEXT_COLOR = (255, 255, 255)
 
+# Pre-rendered 10x10 tiles, blitted in batches instead of drawing a new Rect per cell
+snake_tile = pygame.Surface((10, 10))
+snake_tile.fill(SNAKE_COLOR)
+item_tile = pygame.Surface((10, 10))
+item_tile.fill(ITEM_COLOR)
+obstacle_tile = pygame.Surface((10, 10))
+obstacle_tile.fill(OBSTACLE_COLOR)
+
 # Game settings
 FPS = 60
 clock = pygame.time.Clock()
 
-snake_pos = [(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)]
-snake_direction = 'UP'
+# Head at index 0; a deque makes both head insert and tail pop O(1)
+snake_pos = deque([(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)])
 snake_speed = 10
+
+# Directions are indices into DIRS; opposite directions differ only in the
+# lowest bit, so `a ^ b == 1` means a reversal
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DIRS = ((0, -snake_speed), (0, snake_speed), (-snake_speed, 0), (snake_speed, 0))
+KEY_DIRS = {pygame.K_UP: UP, pygame.K_DOWN: DOWN, pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT}
+
+snake_direction = UP
 change_to = snake_direction
 
-item_pos = [random.randrange(1, (SCREEN_WIDTH // 10)) * 10, random.randrange(1, (SCREEN_HEIGHT // 10)) * 10]
-item_spawn = True
+# Every cell an item or obstacle may spawn on
+GRID = tuple((x * 10, y * 10) for x in range(1, SCREEN_WIDTH // 10) for y in range(1, SCREEN_HEIGHT // 10))
 
-obstacles = []
-for _ in range(10):  # Starting with 10 obstacles
-    obstacles.append([random.randrange(1, (SCREEN_WIDTH // 10)) * 10, random.randrange(1, (SCREEN_HEIGHT // 10)) * 10])
+item_pos = random.choice(GRID)
+
+obstacles = random.sample(GRID, 10)  # Starting with 10 obstacles
+obstacle_set = set(obstacles)
+
+# Cells covered by the snake body, kept in sync with snake_pos for O(1) lookups
+body_set = set(snake_pos)
 
 score = 0
 
@@ -54,7 +75,7 @@ def game_over():
     GO_rect.midtop = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4)
     screen.fill(BACKGROUND_COLOR)
     screen.blit(GO_surface, GO_rect)
-    show_score(0, TEXT_COLOR, 'times', 20)
+    show_score(0, TEXT_COLOR, font, 20)
     pygame.display.flip()
     # Wait 3 seconds then quit
     pygame.time.wait(3000)
@@ -62,8 +83,28 @@ def game_over():
     sys.exit()
 
 def draw_obstacles(obstacles):
-    for obs in obstacles:
-        pygame.draw.rect(screen, OBSTACLE_COLOR, pygame.Rect(obs[0], obs[1], 10, 10))
+    screen.blits([(obstacle_tile, obs) for obs in obstacles], doreturn=False)
+
+# Advance the snake one cell and return True on collision. No pygame calls,
+# so the game logic can be driven without a display.
+def step(direction):
+    global item_pos, score
+    dx, dy = DIRS[direction]
+    head = (snake_pos[0][0] + dx, snake_pos[0][1] + dy)
+
+    # Snake body mechanics
+    snake_pos.appendleft(head)
+    if head == item_pos:
+        score += 1
+        item_pos = random.choice(GRID)
+    else:
+        body_set.discard(snake_pos.pop())
+
+    # Check for collisions
+    if head in body_set or head in obstacle_set:
+        return True
+    body_set.add(head)
+    return False
 
 # Main game loop
 while True:
@@ -72,60 +113,22 @@ while True:
             pygame.quit()
             sys.exit()
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP and change_to != 'DOWN':
-                change_to = 'UP'
-            if event.key == pygame.K_DOWN and change_to != 'UP':
-                change_to = 'DOWN'
-            if event.key == pygame.K_LEFT and change_to != 'RIGHT':
-                change_to = 'LEFT'
-            if event.key == pygame.K_RIGHT and change_to != 'LEFT':
-                change_to = 'RIGHT'
+            new_direction = KEY_DIRS.get(event.key)
+            if new_direction is not None and new_direction ^ change_to != 1:
+                change_to = new_direction
 
     # Validate direction
-    if change_to == 'UP' and snake_direction != 'DOWN':
-        snake_direction = 'UP'
-    if change_to == 'DOWN' and snake_direction != 'UP':
-        snake_direction = 'DOWN'
-    if change_to == 'LEFT' and snake_direction != 'RIGHT':
-        snake_direction = 'LEFT'
-    if change_to == 'RIGHT' and snake_direction != 'LEFT':
-        snake_direction = 'RIGHT'
-
-    if snake_direction == 'UP':
-        snake_pos[0] = (snake_pos[0][0], snake_pos[0][1] - snake_speed)
-    if snake_direction == 'DOWN':
-        snake_pos[0] = (snake_pos[0][0], snake_pos[0][1] + snake_speed)
-    if snake_direction == 'LEFT':
-        snake_pos[0] = (snake_pos[0][0] - snake_speed, snake_pos[0][1])
-    if snake_direction == 'RIGHT':
-        snake_pos[0] = (snake_pos[0][0] + snake_speed, snake_pos[0][1])
-
-    # Snake body mechanics
-    snake_pos.insert(0, list(snake_pos[0]))
-    if snake_pos[0][0] == item_pos[0] and snake_pos[0][1] == item_pos[1]:
-        score += 1
-        item_spawn = False
-    else:
-        snake_pos.pop()
+    if change_to ^ snake_direction != 1:
+        snake_direction = change_to
 
-    if not item_spawn:
-        item_pos = [random.randrange(1, (SCREEN_WIDTH // 10)) * 10, random.randrange(1, (SCREEN_HEIGHT // 10)) * 10]
-    item_spawn = True
+    if step(snake_direction):
+        game_over()
 
     screen.fill(BACKGROUND_COLOR)
 
-    for pos in snake_pos:
-        pygame.draw.rect(screen, SNAKE_COLOR, pygame.Rect(pos[0], pos[1], 10, 10))
-
-    pygame.draw.rect(screen, ITEM_COLOR, pygame.Rect(item_pos[0], item_pos[1], 10, 10))
-
-    # Check for collisions
-    if snake_pos[0] in snake_pos[1:]:
-        game_over()
+    screen.blits([(snake_tile, pos) for pos in snake_pos], doreturn=False)
 
-    for obs in obstacles:
-        if snake_pos[0][0] == obs[0] and snake_pos[0][1] == obs[1]:
-            game_over()
+    screen.blit(item_tile, item_pos)
 
     draw_obstacles(obstacles)
 
@@ -1,10 +1,18 @@
+import asyncio
 import pygame
 import sys
 import random
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 # Initialize Pygame
 pygame.init()
 
+# Only QUIT and KEYDOWN are handled; drop everything else inside SDL
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 # Screen settings
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -16,122 +24,213 @@ WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 RED = (255, 0, 0)
 
+# Fonts are memoized since SysFont has to look the font up on disk
+@lru_cache(maxsize=8)
+def get_font(size, name='arial'):
+    return pygame.font.SysFont(name, size)
+
 # FPS
 clock = pygame.time.Clock()
-FPS = 60
+FPS = 60  # Render rate
+LOGIC_HZ = 60  # Snake moves per second, independent of the render rate
+LOGIC_STEP_MS = 1000 / LOGIC_HZ
+MAX_FRAME_MS = 250  # Cap catch-up after a stall so logic can't spiral
 
 # Snake settings
-snake_pos = [[100, 50], [90, 50], [80, 50]]
-snake_speed = [10, 0]
 snake_size = 10
 
-# Food
-food_pos = [random.randrange(1, (SCREEN_WIDTH//10)) * 10,
-            random.randrange(1, (SCREEN_HEIGHT//10)) * 10]
-food_spawn = True
+# Arrow key -> velocity it turns the snake to
+KEY_DIRS = {
+    pygame.K_UP: (0, -10),
+    pygame.K_DOWN: (0, 10),
+    pygame.K_LEFT: (-10, 0),
+    pygame.K_RIGHT: (10, 0),
+}
 
-# Score
-score = 0
+# Pre-rendered cell tiles, blitted in one batch instead of a Rect per segment
+snake_tile = pygame.Surface((snake_size, snake_size))
+snake_tile.fill(GREEN)
+food_tile = pygame.Surface((snake_size, snake_size))
+food_tile.fill(RED)
 
-# Main menu
-def main_menu():
-    menu = True
-    while menu:
-        for event in pygame.event.get():
+# Food
+# Every cell food may appear on
+GRID = tuple((x * 10, y * 10) for x in range(1, SCREEN_WIDTH//10) for y in range(1, SCREEN_HEIGHT//10))
+
+def spawn_food(occupied):
+    # Only cells the snake does not cover, so food never lands under it
+    return random.choice([cell for cell in GRID if cell not in occupied])
+
+# Runtime state of one round; slots keep attribute access off a __dict__
+@dataclass(slots=True)
+class GameState:
+    # Head at index 0; occupied mirrors the body for O(1) self-collision tests
+    snake: deque = field(default_factory=lambda: deque([(100, 50), (90, 50), (80, 50)]))
+    occupied: set = field(default_factory=set)
+    snake_speed: tuple = (10, 0)
+    food_pos: tuple = (0, 0)
+    food_spawn: bool = True
+    score: int = 0
+
+    def __post_init__(self):
+        self.occupied = set(self.snake)
+        self.food_pos = spawn_food(self.occupied)
+
+# Block until SPACE is pressed. pygame.event.wait() would stall the browser
+# under pygbag, so poll and sleep instead; the process still idles natively
+async def wait_for_space():
+    while True:
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    menu = False
-        
-        screen.fill(BLACK)
-        font = pygame.font.SysFont('arial', 35)
-        text = font.render('Press SPACE to start', True, WHITE)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
-        screen.blit(text, text_rect)
-        pygame.display.flip()
-        clock.tick(FPS)
+                    return
+        await asyncio.sleep(1 / FPS)
+
+# Main menu
+async def main_menu():
+    # The screen is static, so draw it once and wait for input
+    screen.fill(BLACK)
+    font = get_font(35)
+    text = font.render('Press SPACE to start', True, WHITE)
+    text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
+    screen.blit(text, text_rect)
+    pygame.display.flip()
+
+    await wait_for_space()
 
 # Game over
-def game_over():
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    return  # Restart game
-        
-        screen.fill(BLACK)
-        font = pygame.font.SysFont('arial', 35)
-        text = font.render(f'Game Over! Your Score: {score}', True, WHITE)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
-        screen.blit(text, text_rect)
-        
-        restart_text = font.render('Press SPACE to restart', True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 50))
-        screen.blit(restart_text, restart_rect)
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+async def game_over(state):
+    pygame.mouse.set_visible(True)
+
+    # The screen is static, so draw it once and wait for input
+    screen.fill(BLACK)
+    font = get_font(35)
+    text = font.render(f'Game Over! Your Score: {state.score}', True, WHITE)
+    text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2))
+    screen.blit(text, text_rect)
+
+    restart_text = font.render('Press SPACE to restart', True, WHITE)
+    restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 50))
+    screen.blit(restart_text, restart_rect)
+
+    pygame.display.flip()
+
+    await wait_for_space()  # Restart game
 
 # Main game loop
-def game_loop():
-    global snake_pos, food_pos, food_spawn, score, snake_speed
+async def game_loop(state):
+    # Bind globals used every frame to locals, which are cheaper to look up
+    event_get = pygame.event.get
+    handled_events = (pygame.QUIT, pygame.KEYDOWN)
+    key_dirs = KEY_DIRS
+    score_font = get_font(20)
+    fill = screen.fill
+    blits = screen.blits
+    blit = screen.blit
+    update = pygame.display.update
+    tick = clock.tick
+    body = state.snake
+    occupied = state.occupied
+    cell = (snake_size, snake_size)
+    max_x = SCREEN_WIDTH - snake_size
+    max_y = SCREEN_HEIGHT - snake_size
+
+    # Draw the whole field once; after that only cells that change are redrawn
+    # and pushed to the display
+    fill(BLACK)
+    blits([(snake_tile, pos) for pos in body], doreturn=False)
+    blit(food_tile, state.food_pos)
+    update()
+    dirty = []
+
+    # Score text is only re-rendered when the score changes
+    rendered_score = None
+    score_text = None
+    score_rect = pygame.Rect(0, 0, 0, 0)
+
+    # Logic runs in fixed steps, decoupled from how long a frame took
+    accumulator = LOGIC_STEP_MS  # Run one step on the first frame
+    tick()  # Don't count the time spent in the menu
+
+    moved = state.snake_speed  # Velocity of the last logic step
+
+    # The mouse plays no part in the game; hide the cursor while playing
+    pygame.mouse.set_visible(False)
 
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in event_get(handled_events):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP and snake_speed[1] == 0:
-                    snake_speed = [0, -10]
-                elif event.key == pygame.K_DOWN and snake_speed[1] == 0:
-                    snake_speed = [0, 10]
-                elif event.key == pygame.K_LEFT and snake_speed[0] == 0:
-                    snake_speed = [-10, 0]
-                elif event.key == pygame.K_RIGHT and snake_speed[0] == 0:
-                    snake_speed = [10, 0]
-
-        # Snake movement
-        snake_pos.insert(0, list(map(lambda x, y: x + y, snake_pos[0], snake_speed)))
-        if snake_pos[0] in snake_pos[1:]:
-            game_over()
-            return  # Game over
-        if snake_pos[0][0] < 0 or snake_pos[0][0] > SCREEN_WIDTH-snake_size or snake_pos[0][1] < 0 or snake_pos[0][1] > SCREEN_HEIGHT-snake_size:
-            game_over()
-            return  # Game over
-
-        # Food collision
-        if snake_pos[0] == food_pos:
-            score += 1
-            food_spawn = False
-        else:
-            snake_pos.pop()
-
-        # Food spawn
-        if not food_spawn:
-            food_pos = [random.randrange(1, (SCREEN_WIDTH//10)) * 10,
-                        random.randrange(1, (SCREEN_HEIGHT//10)) * 10]
-        food_spawn = True
-
-        # Drawing
-        screen.fill(BLACK)
-        for pos in snake_pos:
-            pygame.draw.rect(screen, GREEN, pygame.Rect(pos[0], pos[1], snake_size, snake_size))
-        pygame.draw.rect(screen, RED, pygame.Rect(food_pos[0], food_pos[1], snake_size, snake_size))
-
-        # Display score
-        score_text = pygame.font.SysFont('arial', 20).render("Score: " + str(score), True, WHITE)
-        screen.blit(score_text, [0, 0])
-
-        pygame.display.flip()
-        clock.tick(FPS)
+                new_speed = key_dirs.get(event.key)
+                # Only turn off the axis of the last move, so several turns
+                # queued before one logic step can't add up to a reversal
+                if new_speed and (new_speed[0] == 0) != (moved[0] == 0):
+                    state.snake_speed = new_speed
+
+        # Fixed-timestep update, after all pending input has been handled
+        while accumulator >= LOGIC_STEP_MS:
+            accumulator -= LOGIC_STEP_MS
+
+            # Snake movement
+            hx, hy = body[0]
+            sx, sy = moved = state.snake_speed
+            new_head = (hx + sx, hy + sy)
+            if new_head in occupied:
+                await game_over(state)
+                return  # Game over
+            if new_head[0] < 0 or new_head[0] > max_x or new_head[1] < 0 or new_head[1] > max_y:
+                await game_over(state)
+                return  # Game over
+            body.appendleft(new_head)
+            occupied.add(new_head)
+            dirty.append(blit(snake_tile, new_head))
+
+            # Food collision
+            if new_head == state.food_pos:
+                state.score += 1
+                state.food_spawn = False
+            else:
+                tail = body.pop()
+                occupied.discard(tail)
+                dirty.append(fill(BLACK, (tail, cell)))
+
+            # Food spawn
+            if not state.food_spawn:
+                state.food_pos = spawn_food(occupied)
+                dirty.append(blit(food_tile, state.food_pos))
+            state.food_spawn = True
+
+        # Display score. It is drawn over the field, so repaint its area
+        # whenever the score or a cell beneath it changed
+        score = state.score
+        if score != rendered_score or score_rect.collidelist(dirty) != -1:
+            if score != rendered_score:
+                rendered_score = score
+                score_text = score_font.render("Score: " + str(score), True, WHITE)
+            area = score_rect.union(score_text.get_rect())
+            fill(BLACK, area)
+            tiles = [(snake_tile, pos) for pos in body if area.colliderect((pos, cell))]
+            if area.colliderect((state.food_pos, cell)):
+                tiles.append((food_tile, state.food_pos))
+            blits(tiles, doreturn=False)
+            score_rect = blit(score_text, (0, 0))
+            dirty.append(area)
+
+        update(dirty)
+        dirty.clear()
+        accumulator += min(tick(FPS), MAX_FRAME_MS)
+        await asyncio.sleep(0)  # Yield to the browser under pygbag
 
 # Game start
-main_menu()
-game_loop()
\ No newline at end of file
+async def main():
+    await main_menu()
+    while True:  # game_over() returns when the player asks to restart
+        await game_loop(GameState())
+
+asyncio.run(main())
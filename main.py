@@ -12,6 +12,8 @@ Run modes:
 """
 
 import asyncio
+import copy
+import functools
 import sys
 from pathlib import Path
 
@@ -23,8 +25,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
-from GameAgent import GameOrchestrator, Config
-from GameAgent.models import UserRequirement, GameGenre, GamePlatform, IterationHistory
+# GameAgent pulls in the LLM stack, so it is imported inside the commands
+# that need it; `check`, `agents` and `--help` start without it.
 
 app = typer.Typer(
     name="gameagent",
@@ -33,6 +35,19 @@ app = typer.Typer(
 console = Console()
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config():
+    """Read the configuration from the environment once per process."""
+    from GameAgent import Config
+
+    return Config.from_env()
+
+
+def get_config():
+    """Return a private copy of the cached configuration for a command to modify."""
+    return copy.copy(_load_config())
+
+
 def show_banner():
     """Display the application banner."""
     banner = """
@@ -57,6 +72,9 @@ def create(
     max_iter: int = typer.Option(3, "--max-iter", "-m", help="Maximum iterations")
 ):
     """Create a new game from your requirements."""
+    from GameAgent import GameOrchestrator
+    from GameAgent.models import UserRequirement, GameGenre, GamePlatform
+
     show_banner()
     
     # Interactive mode
@@ -120,7 +138,7 @@ def create(
     
     # Run the development pipeline
     try:
-        config = Config.from_env()
+        config = get_config()
         config.max_iterations = max_iter
         
         orchestrator = GameOrchestrator(config)
@@ -156,6 +174,9 @@ def demo(
     visual: bool = typer.Option(False, "--visual", "-v", help="Enable visual play mode")
 ):
     """Run a demo game development."""
+    from GameAgent import GameOrchestrator
+    from GameAgent.models import UserRequirement, GameGenre, GamePlatform
+
     show_banner()
     
     console.print("\n[bold]Running Demo - Creating a Snake Game[/bold]\n")
@@ -169,7 +190,7 @@ def demo(
     )
     
     try:
-        config = Config.from_env()
+        config = get_config()
         config.max_iterations = 2  # Quick demo
         
         orchestrator = GameOrchestrator(config)
@@ -194,6 +215,9 @@ def resume(
     visual: bool = typer.Option(False, "--visual", "-v", help="Enable visual play mode")
 ):
     """Resume development from a saved iteration history."""
+    from GameAgent import GameOrchestrator
+    from GameAgent.models import IterationHistory
+
     show_banner()
     
     history_file = Path(history_path)
@@ -218,7 +242,7 @@ def resume(
             console.print("[yellow]Cancelled.[/yellow]")
             raise typer.Exit(0)
         
-        config = Config.from_env()
+        config = get_config()
         orchestrator = GameOrchestrator(config)
         orchestrator.use_visual_play = visual
         